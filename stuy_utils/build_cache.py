@@ -0,0 +1,16 @@
+"""Builds the pre-parsed schedule cache (data/schedules.pkl).
+
+Running `python -m stuy_utils.build_cache` (e.g. as an install step)
+lets later imports load the schedule data with a single pickle read
+instead of parsing the TSV files.
+"""
+from stuy_utils import schedule
+
+
+def main():
+    """Writes data/schedules.pkl from the current TSV files."""
+    schedule.write_schedule_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
+import bisect
 import csv
+import functools
+import os
+import pickle
+import sys
+from array import array
 from collections import namedtuple
-from datetime import date, timedelta
+from email.utils import formatdate
+from datetime import date
 from datetime import datetime as dt
 from datetime import time
 from pathlib import Path
@@ -10,42 +17,143 @@ import warnings
 
 from stuy_utils import errors
 
-Info = namedtuple("Info", ("school", "cycle", "schedule", "testing", "events"))
+Info = namedtuple("Info", ("school", "cycle", "schedule", "testing", "events", "schedule_name"))
 Time = namedtuple("Time", ("start", "end"))
 
+
+class BellSchedule:
+    """A bell schedule stored as parallel arrays.
+
+    Keeps the period names in a tuple alongside int16 arrays of start and
+    end minutes since midnight, so the current period is found with a
+    binary search over plain ints. Also offers the {name: Time} dict-style
+    interface (indexing, iteration, keys/values/items) the module has
+    always exposed, materializing Time namedtuples on demand.
+    """
+
+    __slots__ = ("name", "names", "starts", "ends", "_index", "_sorted")
+
+    def __init__(self, periods: Dict[str, Time], name: Optional[str] = None):
+        self.name = name
+        self.names = tuple(periods)
+        self.starts = array("h", (t.start.hour * 60 + t.start.minute for t in periods.values()))
+        self.ends = array("h", (t.end.hour * 60 + t.end.minute for t in periods.values()))
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+        # The binary search in _find_period_index is only valid on sorted
+        # start times; a data typo (e.g. an AM/PM mixup) must degrade to
+        # the linear scan instead of silently misreporting the period.
+        self._sorted = all(self.starts[i] <= self.starts[i + 1] for i in range(len(self.starts) - 1))
+        if not self._sorted:
+            warnings.warn(f"Bell schedule {name!r} has out-of-order start times; "
+                          "period lookups will fall back to a linear scan.")
+
+    def time_at(self, index: int) -> Time:
+        """Builds the Time namedtuple of the period at an index."""
+        return Time(time(*divmod(self.starts[index], 60)), time(*divmod(self.ends[index], 60)))
+
+    def __getitem__(self, name: str) -> Time:
+        return self.time_at(self._index[name])
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        if self.name is not None:
+            return f"BellSchedule({self.name!r})"
+        return f"BellSchedule({dict(self.items())!r})"
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.names
+
+    def values(self):
+        return [self.time_at(index) for index in range(len(self.names))]
+
+    def items(self):
+        return [(name, self.time_at(index)) for index, name in enumerate(self.names)]
+
 TERM_PATH = f"{Path(__file__).parent}/data/term-days.tsv"
 REGULAR_BELLS_PATH = f"{Path(__file__).parent}/data/regular.tsv"
 CONFERENCE_BELLS_PATH = f"{Path(__file__).parent}/data/conference.tsv"
 HOMEROOM_BELLS_PATH = f"{Path(__file__).parent}/data/homeroom.tsv"
 PTC_BELLS_PATH = f"{Path(__file__).parent}/data/ptc.tsv"
 EXTENDED_HOMEROOM_BELLS_PATH = f"{Path(__file__).parent}/data/extended_homeroom.tsv"
+SCHEDULES_CACHE_PATH = f"{Path(__file__).parent}/data/schedules.pkl"
+
+_DATA_PATHS = (TERM_PATH, REGULAR_BELLS_PATH, CONFERENCE_BELLS_PATH, HOMEROOM_BELLS_PATH, PTC_BELLS_PATH,
+               EXTENDED_HOMEROOM_BELLS_PATH)
+
+# Bumped whenever the shape or meaning of the pickled dicts changes, so
+# a cache written by an older version of the loader is ignored.
+_CACHE_VERSION = 3
+
+
+_TERM_DAYS_URL = ("https://docs.google.com/spreadsheets/d/16BQyzd2rp7UP2nj0wx1I7DvopDhm8sZ65-xSEqE1-5c"
+                  "/export?format=tsv&gid=1814525404")
 
 
 def update_schedule():
     """Updates term-days.tsv.
-    
+
     Makes sure that term-days.tsv is up-to-date by rewriting it with a guaranteed up-to-date version.
-    
+    Sends If-Modified-Since so an unchanged sheet costs no download, and
+    writes through a temp file + rename so readers never see a torn file.
+
     No args, no raises, no return value.
-    
+
     Warns if an exception is encountered when sending a request.
     """
+    headers = {}
+    try:
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(TERM_PATH), usegmt=True)
+    except OSError:
+        pass
+
     try:
-        r = requests.get("https://docs.google.com/spreadsheets/d/16BQyzd2rp7UP2nj0wx1I7DvopDhm8sZ65-xSEqE1-5c/export?format=tsv&gid=1814525404")
+        r = requests.get(_TERM_DAYS_URL, stream=True, timeout=5, headers=headers)
     except requests.ConnectionError:
         warnings.warn("Schedule could not update due to a connection error.")
-    except Exception as e:
-        warnings.warn("Schedule could not update due to an exception: {e}")
-    else:
-        with open('text.tsv', 'wb') as f:
-            f.write(r.content)
+        return
+    except requests.RequestException as e:
+        warnings.warn(f"Schedule could not update due to an exception: {e}")
+        return
 
+    if r.status_code == 304:
+        # The local copy is already current.
+        return
 
-def convert_12h_to_24h(hours12: str) -> str:
-    """Converts a 12-hour time to a 24-hour time.
+    if r.status_code != 200:
+        warnings.warn(f"Schedule could not update: HTTP status {r.status_code}.")
+        return
+
+    tmp_path = TERM_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        for chunk in r.iter_content(chunk_size=1 << 20):
+            f.write(chunk)
+
+    # Only replace the data file if the download looks like the sheet.
+    with open(tmp_path, "rb") as f:
+        valid = f.read(5) == b"Date\t"
+
+    if not valid:
+        warnings.warn("Schedule could not update: unexpected response content.")
+        os.remove(tmp_path)
+        return
+
+    os.replace(tmp_path, TERM_PATH)
 
-    Converts a 12-hour time to a 24-hour time by adding 12 hours to the
-    hour if the time is in the PM.
+
+def _parse_12h_to_time(hours12: str) -> time:
+    """Parses a 12-hour time string straight into a time object.
+
+    Skips the 24-hour string round-trip entirely: split once, do the
+    AM/PM hour math on ints, and construct datetime.time directly.
 
     Args:
         hours12: A string representing a 12-hour time.
@@ -57,37 +165,70 @@ def convert_12h_to_24h(hours12: str) -> str:
         (i.e. doesn't contain AM or PM, or hours > 12).
 
     Returns:
-        str: A string representing a 24-hour time, with 0 prepended
-        to the front of the time if the hour is less than 10.
+        datetime.time: The parsed time of day.
     """
-
     if not isinstance(hours12, str):
         raise errors.InvalidTime(hours12)
 
-    if "AM" in hours12 or "PM" in hours12:
-        hours12time = hours12.split(" ")[0]
-        am_pm = hours12.split(" ")[1]
-    else:
+    # The " AM"/" PM" suffix is checked with its separator, so inputs like
+    # "11:30PM" raise instead of being sliced into the wrong time.
+    if not (hours12.endswith(" AM") or hours12.endswith(" PM")) or ":" not in hours12:
         raise errors.InvalidTime(hours12)
 
-    if ":" not in hours12:
+    try:
+        hours, minutes = hours12[:-3].split(":")
+        hour = int(hours)
+        minute = int(minutes)
+    except ValueError:
         raise errors.InvalidTime(hours12)
 
-    hours, minutes = hours12time.split(":")
-
-    if int(hours) > 12:
+    # Bounds-check before constructing the time so out-of-range values
+    # raise InvalidTime rather than leaking time()'s ValueError.
+    if not 0 <= hour <= 12 or not 0 <= minute <= 59:
         raise errors.InvalidTime(hours12)
 
     # Account for 12:00 AM being 0 hours
-    if hours == "12":
-        hours = "0"
-    if am_pm == "PM":
-        hours = str(int(hours) + 12)
+    hour %= 12
+    if hours12.endswith("PM"):
+        hour += 12
 
-    if int(hours) < 10:
-        hours = f"0{hours}"
+    return time(hour, minute)
 
-    return f"{hours}:{minutes}"
+
+def convert_12h_to_24h(hours12: str) -> str:
+    """Converts a 12-hour time to a 24-hour time.
+
+    Converts a 12-hour time to a 24-hour time by adding 12 hours to the
+    hour if the time is in the PM.
+
+    Args:
+        hours12: A string representing a 12-hour time.
+        e.g "1:00 PM"
+
+    Raises:
+        errors.InvalidTime: Thrown if the input is not a string.
+        errors.InvalidTime: Thrown if the input isn't a 12-hour time
+        (i.e. doesn't contain AM or PM, or hours > 12).
+
+    Returns:
+        str: A string representing a 24-hour time, with 0 prepended
+        to the front of the time if the hour is less than 10.
+    """
+    parsed = _parse_12h_to_time(hours12)
+    return f"{parsed.hour:02}:{parsed.minute:02}"
+
+
+def _hhmm_to_min(hours24: str) -> int:
+    """Converts a known-good "H:MM"/"HH:MM" string to minutes since midnight.
+
+    Trusted fast path: straight ord arithmetic on the digit characters,
+    with no split or int calls. Callers validate the shape first.
+    """
+    if len(hours24) == 5:
+        return (ord(hours24[0]) - 48) * 600 + (ord(hours24[1]) - 48) * 60 \
+            + (ord(hours24[3]) - 48) * 10 + ord(hours24[4]) - 48
+
+    return (ord(hours24[0]) - 48) * 60 + (ord(hours24[2]) - 48) * 10 + ord(hours24[3]) - 48
 
 
 def convert_24h_to_minutes(hours24: str) -> int:
@@ -110,37 +251,249 @@ def convert_24h_to_minutes(hours24: str) -> int:
     if not isinstance(hours24, str):
         raise errors.InvalidTime(hours24)
 
-    if ":" not in hours24:
-        raise errors.InvalidTime(hours24)
+    hours, _, minutes = hours24.partition(":")
 
-    hours, minutes = hours24.split(":")
+    if not minutes or not hours.isdigit() or not minutes.isdigit():
+        raise errors.InvalidTime(hours24)
 
     if int(hours) > 24:
         raise errors.InvalidTime(hours24)
 
+    # isdigit() also accepts non-ASCII decimal digits, which would break
+    # the ord arithmetic; those take the int() path below instead.
+    if len(hours) <= 2 and len(minutes) == 2 and hours24.isascii():
+        return _hhmm_to_min(hours24)
+
     return int(hours) * 60 + int(minutes)
 
 
-update_schedule()
-with open(TERM_PATH, "r") as term_tsv, open(REGULAR_BELLS_PATH, "r") as regular_tsv, open(CONFERENCE_BELLS_PATH,
-                                                                                          "r") as conference_tsv, open(
-    HOMEROOM_BELLS_PATH, "r") as homeroom_tsv:
-    TERM_DAYS = {row[0]: Info(*row[1:]) for row in list(csv.reader(term_tsv, delimiter="\t"))[1:]}
-    REGULAR_BELL_SCHEDULE = {row[0]: Time(*[time.fromisoformat(convert_12h_to_24h(element)) for element in row[1:]]) for
-                             row in
-                             list(csv.reader(regular_tsv, delimiter="\t"))[1:]}
-    CONFERENCE_BELL_SCHEDULE = {row[0]: Time(*[time.fromisoformat(convert_12h_to_24h(element)) for element in row[1:]])
-                                for row in
-                                list(csv.reader(conference_tsv, delimiter="\t"))[1:]}
-    HOMEROOM_BELL_SCHEDULE = {row[0]: Time(*[time.fromisoformat(convert_12h_to_24h(element)) for element in row[1:]])
-                              for row in
-                              list(csv.reader(homeroom_tsv, delimiter="\t"))[1:]}
-    PTC_BELL_SCHEDULE = {row[0]: Time(*[time.fromisoformat(convert_12h_to_24h(element)) for element in row[1:]]) for row
-                         in
-                         list(csv.reader(homeroom_tsv, delimiter="\t"))[1:]}
-    EXTENDED_HOMEROOM_BELL_SCHEDULE = {
-        row[0]: Time(*[time.fromisoformat(convert_12h_to_24h(element)) for element in row[1:]]) for row in
-        list(csv.reader(homeroom_tsv, delimiter="\t"))[1:]}
+_TIME_CACHE: Dict[str, time] = {}
+
+
+def _cached_time(hours12: str) -> time:
+    """Parses a 12-hour time into a time object, reusing repeated values.
+
+    The bell-schedule files share most of their bell times, so a
+    module-level cache collapses the repeated cells into a handful of
+    unique parses at import time.
+
+    Args:
+        hours12: A string representing a 12-hour time.
+        e.g "1:00 PM"
+
+    Returns:
+        datetime.time: The parsed time of day.
+    """
+    parsed = _TIME_CACHE.get(hours12)
+    if parsed is None:
+        parsed = _TIME_CACHE[hours12] = _parse_12h_to_time(hours12)
+    return parsed
+
+
+_ScheduleData = namedtuple("_ScheduleData",
+                           ("term_days", "regular", "conference", "homeroom", "ptc", "extended_homeroom", "by_name",
+                            "date_keys", "school_next", "next_class", "next_class_skip"))
+
+# Maps the module attributes users import to fields of _ScheduleData, so
+# __getattr__ below can serve them lazily (PEP 562).
+_LAZY_EXPORTS = {
+    "TERM_DAYS": "term_days",
+    "REGULAR_BELL_SCHEDULE": "regular",
+    "CONFERENCE_BELL_SCHEDULE": "conference",
+    "HOMEROOM_BELL_SCHEDULE": "homeroom",
+    "PTC_BELL_SCHEDULE": "ptc",
+    "EXTENDED_HOMEROOM_BELL_SCHEDULE": "extended_homeroom",
+}
+
+
+def _load_bell_tsv(path: str) -> Dict[str, Time]:
+    """Parses one bell-schedule TSV into a {category: Time} dict."""
+    with open(path, "r") as bell_tsv:
+        rows = list(csv.reader(bell_tsv, delimiter="\t"))
+
+    return {sys.intern(row[0]): Time(*[_cached_time(element) for element in row[1:]]) for row in rows[1:]}
+
+
+def _parse_tsvs():
+    """Parses the TSV data files into the term-day and bell-schedule dicts."""
+    with open(TERM_PATH, "r") as term_tsv:
+        # Normalize the "True"/"None" sentinel strings here, once, so every
+        # lookup afterwards returns a ready-made Info with real bools/Nones.
+        # The enumerable fields (date key, cycle, schedule name) are interned:
+        # csv.reader allocates a fresh string per cell, and interning makes
+        # later dict hashing and equality checks pointer comparisons. The
+        # free-form testing/events text is left alone.
+        # The schedule field is resolved to a BellSchedule object by
+        # _load_schedules; schedule_name keeps the raw name either way.
+        term_days = {sys.intern(row[0]): Info(school=row[1] == "True",
+                                              cycle=sys.intern(row[2]) if row[2] != "None" else None,
+                                              schedule=None,
+                                              testing=row[4] if row[4] != "None" else None,
+                                              events=row[5] if row[5] != "None" else None,
+                                              schedule_name=sys.intern(row[3]) if row[3] != "None" else None)
+                     for row in list(csv.reader(term_tsv, delimiter="\t"))[1:]}
+
+    return (term_days,
+            _load_bell_tsv(REGULAR_BELLS_PATH),
+            _load_bell_tsv(CONFERENCE_BELLS_PATH),
+            _load_bell_tsv(HOMEROOM_BELLS_PATH),
+            _load_bell_tsv(PTC_BELLS_PATH),
+            _load_bell_tsv(EXTENDED_HOMEROOM_BELLS_PATH))
+
+
+def _read_schedule_cache():
+    """Loads the pre-parsed dicts from data/schedules.pkl, if still fresh.
+
+    Returns None when the cache is missing, older than any of the TSV
+    files, unreadable, or written by a different loader version; callers
+    then fall back to parsing the TSVs.
+    """
+    try:
+        cache_mtime = os.path.getmtime(SCHEDULES_CACHE_PATH)
+        if any(os.path.getmtime(path) > cache_mtime for path in _DATA_PATHS):
+            return None
+        with open(SCHEDULES_CACHE_PATH, "rb") as cache_file:
+            version, parsed = pickle.load(cache_file)
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        return None
+
+    return parsed if version == _CACHE_VERSION else None
+
+
+def write_schedule_cache():
+    """Writes the parsed dicts to data/schedules.pkl.
+
+    Run via `python -m stuy_utils.build_cache` (e.g. as an install step)
+    so later imports skip TSV parsing and do a single pickle load.
+
+    No args, no raises, no return value.
+    """
+    with open(SCHEDULES_CACHE_PATH, "wb") as cache_file:
+        pickle.dump((_CACHE_VERSION, _parse_tsvs()), cache_file)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schedules() -> _ScheduleData:
+    """Loads the schedule data, once, on first use.
+
+    Loading used to happen at import time (after a blocking network
+    request); deferring it here means importing the module costs nothing
+    until a schedule is actually needed. Reads the prebuilt pickle cache
+    when one is fresh, otherwise parses the TSV files, then derives the
+    lookup tables either way.
+
+    Returns:
+        _ScheduleData: A namedtuple of the term-day dict, the five
+        bell-schedule dicts, and the derived lookup tables.
+    """
+    parsed = _read_schedule_cache()
+    if parsed is None:
+        parsed = _parse_tsvs()
+
+    term_days = parsed[0]
+    regular = BellSchedule(parsed[1], "Regular")
+    conference = BellSchedule(parsed[2], "Conference")
+    homeroom = BellSchedule(parsed[3], "Homeroom")
+    ptc = BellSchedule(parsed[4], "PTC")
+    extended_homeroom = BellSchedule(parsed[5], "Extended Homeroom")
+
+    by_name = {sched.name: sched for sched in (regular, conference, homeroom, ptc, extended_homeroom)}
+
+    # Resolve each day's schedule name to the BellSchedule itself, so
+    # Info.schedule is the schedule and no name dispatch happens per call.
+    # Names without a bell-schedule file (e.g. "PSAT") resolve to None but
+    # stay readable through Info.schedule_name.
+    term_days = {iso: info._replace(schedule=by_name.get(info.schedule_name)) for iso, info in term_days.items()}
+
+    # Successor tables per schedule (keyed by dict identity): name -> the
+    # (next_name, next_time) item, or None for the last period, with a
+    # variant that skips passing periods. get_next_class then avoids
+    # materializing and scanning the key list on every call.
+    next_class = {}
+    next_class_skip = {}
+    for sched in (regular, conference, homeroom, ptc, extended_homeroom):
+        items = sched.items()
+        table = {}
+        skip_table = {}
+        for i, name in enumerate(sched):
+            successor = items[i + 1] if i + 1 < len(items) else None
+            table[name] = successor
+            if successor is not None and "Passing" in successor[0]:
+                successor = items[i + 2] if i + 2 < len(items) else None
+            skip_table[name] = successor
+        next_class[id(sched)] = table
+        next_class_skip[id(sched)] = skip_table
+
+    # Sorted ISO keys plus, for each position, the index of the first school
+    # day at or after it (built in one reverse pass). Next-school-day queries
+    # become a binary search instead of a day-by-day walk over long breaks.
+    date_keys = sorted(term_days)
+    school_next = [len(date_keys)] * (len(date_keys) + 1)
+    for i in range(len(date_keys) - 1, -1, -1):
+        school_next[i] = i if term_days[date_keys[i]].school else school_next[i + 1]
+
+    return _ScheduleData(term_days, regular, conference, homeroom, ptc, extended_homeroom, by_name,
+                         date_keys, school_next, next_class, next_class_skip)
+
+
+def __getattr__(name: str):
+    """Loads the schedule data lazily on first attribute access."""
+    field = _LAZY_EXPORTS.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_load_schedules(), field)
+
+
+def ensure_fresh(max_age_seconds: int = 86400):
+    """Refreshes term-days.tsv if the local copy looks stale.
+
+    Replaces the update-on-every-import behavior: callers who want a
+    guaranteed-recent schedule opt in explicitly, and the download is
+    skipped entirely while the local file is newer than max_age_seconds.
+
+    Args:
+        max_age_seconds (int, optional): Maximum age of term-days.tsv
+        before a refresh is attempted. Defaults to 86400 (one day).
+
+    No raises, no return value.
+    """
+    try:
+        age = dt.now().timestamp() - os.path.getmtime(TERM_PATH)
+    except OSError:
+        age = max_age_seconds + 1
+
+    if age <= max_age_seconds:
+        return
+
+    update_schedule()
+    _load_schedules.cache_clear()
+    _get_day_info_iso.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso(day: date) -> str:
+    """Caches date -> ISO string conversions for repeated queries."""
+    return day.isoformat()
+
+
+def _normalize(day: Union[date, dt]) -> str:
+    """Validates a date or datetime and returns its ISO date string.
+
+    Shared by every public function taking a day, so the isinstance
+    checks and datetime demotion run once per user call instead of once
+    per layer of the composed lookup paths.
+
+    Raises:
+        errors.InvalidDate: Thrown if the input is not a date or a datetime
+        object.
+    """
+    if not isinstance(day, date):
+        raise errors.InvalidDate(day)
+
+    if isinstance(day, dt):
+        day = day.date()  # Converts datetime to date to remove time
+
+    return _iso(day)
 
 
 def convert_to_isoformat(day: Union[date, dt]) -> str:
@@ -163,19 +516,10 @@ def convert_to_isoformat(day: Union[date, dt]) -> str:
     Returns:
         str: A date using the ISO 8601 format (yyyy-mm-dd).
     """
-    if not isinstance(day, date):
-        raise errors.InvalidDate(day)
-
-    if isinstance(day, dt):
-        day = day.date()  # Converts datetime to date to remove time
-
-    iso_date = day.isoformat()
+    iso_date = _normalize(day)
 
-    # if this code is not commented out, it will throw errors since TERM_DAYS is nonexistent.
-    """
-    if iso_date not in TERM_DAYS:
+    if iso_date not in _load_schedules().term_days:
         raise errors.DayNotInData(iso_date)
-    """
 
     return iso_date
 
@@ -197,27 +541,24 @@ def get_day_info(day: Union[date, dt]) -> Info:
         term_days.csv.
 
     Returns:
-        Info: A namedtuple with fields 'school', 'cycle', 'schedule', 'testing', and 'events'.
+        Info: A namedtuple with fields 'school', 'cycle', 'schedule', 'testing',
+        'events', and 'schedule_name'. 'schedule' holds the day's BellSchedule
+        (None when the named schedule has no bell-schedule file);
+        'schedule_name' always holds the raw name from the data.
     """
 
-    if not isinstance(day, date):
-        raise errors.InvalidDate(day)
+    return _get_day_info_iso(_normalize(day))
 
-    if isinstance(day, dt):
-        day = day.date()  # Converts datetime to date to remove time
 
-    iso_date = day.isoformat()
+@functools.lru_cache(maxsize=512)
+def _get_day_info_iso(iso_date: str) -> Info:
+    """Looks up the prebuilt Info tuple for an ISO date string."""
+    term_days = _load_schedules().term_days
 
-    if iso_date not in TERM_DAYS:
+    if iso_date not in term_days:
         raise errors.DayNotInData(iso_date)
 
-    ret_tuple = Info(school=True if TERM_DAYS[iso_date][0] == "True" else False,
-                     cycle=TERM_DAYS[iso_date][1] if TERM_DAYS[iso_date][1] != "None" else None,
-                     schedule=TERM_DAYS[iso_date][2] if TERM_DAYS[iso_date][2] != "None" else None,
-                     testing=TERM_DAYS[iso_date][3] if TERM_DAYS[iso_date][3] != "None" else None,
-                     events=TERM_DAYS[iso_date][4] if TERM_DAYS[iso_date][4] != "None" else None, )
-
-    return ret_tuple
+    return term_days[iso_date]
 
 
 def get_next_school_day(day: Union[date, dt], always_same: bool = False) -> Optional[date]:
@@ -242,33 +583,31 @@ def get_next_school_day(day: Union[date, dt], always_same: bool = False) -> Opti
         of the next school day.
     """
 
-    if not isinstance(day, date):
-        raise errors.InvalidDate(day)
+    iso_date = _normalize(day)
 
-    if isinstance(day, dt):
-        day = day.date()  # Converts datetime to date to remove time
-
-    iso_date = day.isoformat()
+    data = _load_schedules()
 
-    if iso_date not in TERM_DAYS:
+    if iso_date not in data.term_days:
         raise errors.DayNotInData(iso_date)
 
-    if TERM_DAYS[iso_date][0] == "True":
-        return day
+    if data.term_days[iso_date].school or always_same:
+        return date.fromisoformat(iso_date)
 
-    if always_same:
-        return day
+    return _next_school_day_iso(iso_date)
 
-    next_day = day + timedelta(days=1)
-    while get_day_info(next_day).school is False:
-        if next_day.isoformat() not in TERM_DAYS:
-            return None
-        next_day = next_day + timedelta(days=1)
 
-    return next_day
+def _next_school_day_iso(iso_date: str) -> Optional[date]:
+    """Finds the first school day strictly after a known ISO date."""
+    data = _load_schedules()
 
+    index = data.school_next[bisect.bisect_right(data.date_keys, iso_date)]
+    if index == len(data.date_keys):
+        # No school day left in the term data.
+        return None
+    return date.fromisoformat(data.date_keys[index])
 
-def get_bell_schedule(day: Union[date, dt], this_day: bool = False) -> Optional[dict]:
+
+def get_bell_schedule(day: Union[date, dt], this_day: bool = False) -> Optional[BellSchedule]:
     """Returns the bell periods of the next school day.
 
     Returns a dictionary of bell periods of the next school day. If the given
@@ -286,47 +625,33 @@ def get_bell_schedule(day: Union[date, dt], this_day: bool = False) -> Optional[
         term_days.csv.
 
     Returns:
-        Dict[str, Time]: A dictionary of keys of strings of the category name
-        (see data/bell_schedule.csv) and values of Time namedtuple objects with
-        fields 'start' and 'end', which returns a datetime object.
+        BellSchedule: A dict-style mapping of keys of strings of the category
+        name (see data/bell_schedule.csv) and values of Time namedtuple
+        objects with fields 'start' and 'end', which returns a datetime object.
     """
 
-    if not isinstance(day, date):
-        raise errors.InvalidDate(day)
-
-    if isinstance(day, dt):
-        day = day.date()  # Converts datetime to date to remove time
+    iso_date = _normalize(day)
 
-    iso_date = day.isoformat()
+    data = _load_schedules()
 
-    if iso_date not in TERM_DAYS:
+    info = data.term_days.get(iso_date)
+    if info is None:
         raise errors.DayNotInData(iso_date)
 
-    if TERM_DAYS[iso_date][0] == "True":
-        if TERM_DAYS[iso_date][2] == "None":
-            # should never happen, but return regular bell schedule if it does
-            return None
-        else:
-            if TERM_DAYS[iso_date][2] == "Regular":
-                return REGULAR_BELL_SCHEDULE
-            elif TERM_DAYS[iso_date][2] == "Conference":
-                return CONFERENCE_BELL_SCHEDULE
-            elif TERM_DAYS[iso_date][2] == "Homeroom":
-                return HOMEROOM_BELL_SCHEDULE
-            elif TERM_DAYS[iso_date][2] == "PTC":
-                return PTC_BELL_SCHEDULE
-            elif TERM_DAYS[iso_date][2] == "Extended Homeroom":
-                return EXTENDED_HOMEROOM_BELL_SCHEDULE
-            else:
-                return None
-
-    else:
-        if this_day:
-            return None
-        else:
-            # next day, use get_next_school_day
-            next_day = get_next_school_day(day)
-            return get_bell_schedule(next_day)
+    if info.school:
+        # None for a schedule of None (which should never happen) or an
+        # unrecognized schedule name.
+        return info.schedule
+
+    if this_day:
+        return None
+
+    next_day = _next_school_day_iso(iso_date)
+    if next_day is None:
+        # No school day left in the term data.
+        return None
+
+    return data.term_days[_iso(next_day)].schedule
 
 
 def get_current_class(day: dt) -> Optional[Tuple[str, Time]]:
@@ -349,13 +674,44 @@ def get_current_class(day: dt) -> Optional[Tuple[str, Time]]:
         (see data/bell_schedule.csv), and a Time namedtuple object with fields
         'start' and 'end', which returns a datetime object.
     """
+    found = _find_period_index(day)
+    if found is None:
+        return None
+
+    schedule, index = found
+    return schedule.names[index], schedule.time_at(index)
+
+
+def _find_period_index(day: dt) -> Optional[Tuple[BellSchedule, int]]:
+    """Locates the current period as a (schedule, index) pair.
+
+    Shared core of get_current_class and get_current_period; callers pick
+    out the name and/or Time themselves, so name-only queries skip the
+    Time materialization entirely.
+    """
     schedule = get_bell_schedule(day)
 
-    day = day.time()
+    if schedule is None:
+        # No school day left in the term data, or a schedule name without
+        # a bell-schedule file (e.g. "PSAT").
+        return None
+
+    minutes = day.hour * 60 + day.minute
 
-    for item in schedule.items():
-        if item[1].start <= day <= item[1].end:
-            return item
+    if schedule._sorted:
+        # Bell periods are ordered and non-overlapping, so the current one
+        # is the last whose start is at or before now.
+        index = bisect.bisect_right(schedule.starts, minutes) - 1
+
+        if index >= 0 and minutes <= schedule.ends[index]:
+            return schedule, index
+
+        return None
+
+    # Degraded path for schedules with out-of-order start times.
+    for index, start in enumerate(schedule.starts):
+        if start <= minutes <= schedule.ends[index]:
+            return schedule, index
 
     return None
 
@@ -384,29 +740,21 @@ def get_next_class(day: dt, skip_passing: bool = False) -> Optional[Tuple[str, T
 
     schedule = get_bell_schedule(day)
 
+    if schedule is None:
+        # No school day left in the term data, or a schedule name without
+        # a bell-schedule file (e.g. "PSAT").
+        return None
+
     current_class = get_current_class(day)
 
     if current_class is None:
         return next(iter(schedule.items()))
 
-    else:
-        # Find index of current class
-        index = list(schedule.keys()).index(current_class[0])
-
-        # If the current class is the last class, return None
-        if index == len(schedule.keys()) - 1:
-            return None
+    data = _load_schedules()
+    table = data.next_class_skip if skip_passing else data.next_class
 
-        # Otherwise, find the next class
-        else:
-            next_class = list(schedule.keys())[index + 1]
-            # If next class name contains "Passing", skip it
-            if skip_passing and "Passing" in next_class:
-                next_class = list(schedule.keys())[index + 2]
-            else:
-                return next_class, schedule[next_class]
-
-            return next_class, schedule[next_class]
+    # None if the current class is the last one in the schedule
+    return table[id(schedule)][current_class[0]]
 
 
 def get_current_period(time_of_period: dt) -> Optional[str]:
@@ -428,10 +776,10 @@ def get_current_period(time_of_period: dt) -> Optional[str]:
         Optional[str]: A string of the category name (see data/bell_schedule.csv)
     """
 
-    current_class = get_current_class(time_of_period)
+    found = _find_period_index(time_of_period)
 
-    if current_class is None:
+    if found is None:
         return None
 
-    else:
-        return current_class[0]
+    schedule, index = found
+    return schedule.names[index]